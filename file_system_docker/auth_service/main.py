@@ -1,45 +1,118 @@
+import asyncio
 import grpc
-from concurrent import futures
 import auth_pb2
 import auth_pb2_grpc
 from google.protobuf import empty_pb2
+from pymemcache.client.hash import HashClient
+from pymemcache.exceptions import MemcacheIllegalInputError
 import logging
+import os
+
+# Sessions live in Memcached so that any number of Auth workers share them.
+# Servers are given as "host:port,host:port"; keys are sharded by SessionID.
+MEMCACHED_SERVERS = os.getenv('MEMCACHED_SERVERS', 'memcached:11211')
+SESSION_TTL = int(os.getenv('SESSION_TTL', '3600'))
+
+# Accept client keepalive pings (the test suite pings every 10s) without GOAWAY too_many_pings
+SERVER_OPTIONS = [
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.min_ping_interval_without_data_ms', 5000),
+]
+
+
+class SessionStore:
+    """
+    Thin wrapper over a sharded Memcached client.
+    Stores the serialized User proto under its SessionID.
+    pymemcache is blocking, so the async servicer calls it via asyncio.to_thread.
+    """
+    def __init__(self, servers, ttl):
+        nodes = []
+        for node in servers.split(','):
+            host, port = node.strip().rsplit(':', 1)
+            nodes.append((host, int(port)))
+        self.client = HashClient(nodes, use_pooling=True, connect_timeout=1, timeout=1)
+        self.ttl = ttl
+
+    def set(self, session_id, user):
+        # noreply=False: the session must be visible before CreateSession returns.
+        # HashClient returns False (no exception) while a node is marked dead
+        return self.client.set(session_id, user.SerializeToString(), expire=self.ttl, noreply=False)
+
+    def set_many(self, sessions):
+        # One multi-set per Memcached node instead of a round-trip per session.
+        # Returns the SessionIDs that were not stored (e.g. their node is marked dead)
+        return self.client.set_many(
+            {sid: user.SerializeToString() for sid, user in sessions.items()},
+            expire=self.ttl, noreply=False
+        )
+
+    def get(self, session_id):
+        try:
+            blob = self.client.get(session_id)
+        except MemcacheIllegalInputError:
+            # Malformed token (spaces, too long, ...) can never be a valid key
+            return None
+        if blob is None:
+            return None
+        user = auth_pb2.User()
+        user.ParseFromString(blob)
+        return user
+
+    def delete(self, session_id):
+        try:
+            self.client.delete(session_id)
+        except MemcacheIllegalInputError:
+            pass
 
-# We no longer strictly enforce a USERS_DB for the mock,
-# so that the Test Suite can generate random User IDs.
-ACTIVE_SESSIONS = {}
 
 class AuthServiceMock(auth_pb2_grpc.AuthServicer):
-    
-    def CreateSession(self, request, context):
+
+    def __init__(self, store):
+        self.store = store
+
+    async def CreateSession(self, request, context):
         """
         Creates a session for ANY user ID sent by the test suite.
         """
-        # We removed the 'if request.user.ID not in USERS_DB' check
-        
-        ACTIVE_SESSIONS[request.SessionID] = request.user
+        # We no longer strictly enforce a USERS_DB for the mock,
+        # so that the Test Suite can generate random User IDs.
+        if not await asyncio.to_thread(self.store.set, request.SessionID, request.user):
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Session store unavailable")
         # print(f"[Auth] Session created for User {request.user.ID}")
         return empty_pb2.Empty()
 
-    def Logout(self, request, context):
-        if request.SessionID in ACTIVE_SESSIONS:
-            del ACTIVE_SESSIONS[request.SessionID]
+    async def CreateSessions(self, request_iterator, context):
+        """
+        Client-streaming variant of CreateSession: stores every session
+        from the stream in one batch once the client half-closes.
+        """
+        sessions = {request.SessionID: request.user async for request in request_iterator}
+        failed = await asyncio.to_thread(self.store.set_many, sessions)
+        if failed:
+            await context.abort(grpc.StatusCode.UNAVAILABLE,
+                                f"Session store unavailable: {len(failed)} of {len(sessions)} sessions not stored")
+        return empty_pb2.Empty()
+
+    async def Logout(self, request, context):
+        await asyncio.to_thread(self.store.delete, request.SessionID)
         return empty_pb2.Empty()
 
-    def GetCurrentUser(self, request, context):
-        if request.SessionID in ACTIVE_SESSIONS:
-            return ACTIVE_SESSIONS[request.SessionID]
-        else:
-            context.abort(grpc.StatusCode.UNAUTHENTICATED, "Invalid Session")
+    async def GetCurrentUser(self, request, context):
+        user = await asyncio.to_thread(self.store.get, request.SessionID)
+        if user is None:
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Invalid Session")
+        return user
 
-def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    auth_pb2_grpc.add_AuthServicer_to_server(AuthServiceMock(), server)
+async def serve():
+    store = SessionStore(MEMCACHED_SERVERS, SESSION_TTL)
+    server = grpc.aio.server(options=SERVER_OPTIONS)
+    auth_pb2_grpc.add_AuthServicer_to_server(AuthServiceMock(store), server)
     server.add_insecure_port('[::]:50053')
-    print("Auth Service (Permissive Mock) running on port 50053")
-    server.start()
-    server.wait_for_termination()
+    print(f"Auth Service (Permissive Mock) running on port 50053, sessions in {MEMCACHED_SERVERS}")
+    await server.start()
+    await server.wait_for_termination()
 
 if __name__ == '__main__':
     logging.basicConfig()
-    serve()
+    asyncio.run(serve())
@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nauth.proto\x12\x08protobuf\x1a\x1bgoogle/protobuf/empty.proto\"?\n\x0c\x46ullUserData\x12\x1c\n\x04user\x18\x01 \x01(\x0b\x32\x0e.protobuf.User\x12\x11\n\tSessionID\x18\x02 \x01(\t\" \n\x0bSessionData\x12\x11\n\tSessionID\x18\x01 \x01(\t\"1\n\x04User\x12\n\n\x02ID\x18\x01 \x01(\r\x12\r\n\x05\x45mail\x18\x02 \x01(\t\x12\x0e\n\x06IsAuth\x18\x04 \x01(\x08\x32\xb9\x01\n\x04\x41uth\x12?\n\rCreateSession\x12\x16.protobuf.FullUserData\x1a\x16.google.protobuf.Empty\x12\x37\n\x0eGetCurrentUser\x12\x15.protobuf.SessionData\x1a\x0e.protobuf.User\x12\x37\n\x06Logout\x12\x15.protobuf.SessionData\x1a\x16.google.protobuf.EmptyB\x0eZ\x0c\x65xample/authb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nauth.proto\x12\x08protobuf\x1a\x1bgoogle/protobuf/empty.proto\"?\n\x0c\x46ullUserData\x12\x1c\n\x04user\x18\x01 \x01(\x0b\x32\x0e.protobuf.User\x12\x11\n\tSessionID\x18\x02 \x01(\t\" \n\x0bSessionData\x12\x11\n\tSessionID\x18\x01 \x01(\t\"1\n\x04User\x12\n\n\x02ID\x18\x01 \x01(\r\x12\r\n\x05\x45mail\x18\x02 \x01(\t\x12\x0e\n\x06IsAuth\x18\x04 \x01(\x08\x32\xfd\x01\n\x04\x41uth\x12?\n\rCreateSession\x12\x16.protobuf.FullUserData\x1a\x16.google.protobuf.Empty\x12\x42\n\x0e\x43reateSessions\x12\x16.protobuf.FullUserData\x1a\x16.google.protobuf.Empty(\x01\x12\x37\n\x0eGetCurrentUser\x12\x15.protobuf.SessionData\x1a\x0e.protobuf.User\x12\x37\n\x06Logout\x12\x15.protobuf.SessionData\x1a\x16.google.protobuf.EmptyB\x0eZ\x0c\x65xample/authb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -40,5 +40,5 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_USER']._serialized_start=152
   _globals['_USER']._serialized_end=201
   _globals['_AUTH']._serialized_start=204
-  _globals['_AUTH']._serialized_end=389
+  _globals['_AUTH']._serialized_end=457
 # @@protoc_insertion_point(module_scope)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rcatalog.proto\x12\x07\x63\x61talog\"\x97\x01\n\x11\x44irectoryResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tparent_id\x18\x03 \x01(\t\x12\x11\n\tis_public\x18\x04 \x01(\x08\x12\x10\n\x08owner_id\x18\x05 \x01(\r\x12\x17\n\x0f\x61llowed_readers\x18\x06 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x07 \x03(\r\"\x99\x01\n\x0c\x46ileResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x18\n\x10\x65xternal_file_id\x18\x03 \x01(\t\x12\x11\n\tis_public\x18\x04 \x01(\x08\x12\x10\n\x08owner_id\x18\x05 \x01(\r\x12\x17\n\x0f\x61llowed_readers\x18\x06 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x07 \x03(\r\"~\n\x16\x43reateDirectoryRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tparent_id\x18\x02 \x01(\t\x12\x11\n\tis_public\x18\x03 \x01(\x08\x12\x17\n\x0f\x61llowed_readers\x18\x04 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x05 \x03(\r\"\x8a\x01\n\x16UpdateDirectoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tparent_id\x18\x03 \x01(\t\x12\x11\n\tis_public\x18\x04 \x01(\x08\x12\x17\n\x0f\x61llowed_readers\x18\x05 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x06 \x03(\r\"$\n\x16\x44\x65leteDirectoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\"+\n\x13GetDirectoryRequest\x12\x14\n\x0c\x64irectory_id\x18\x01 \x01(\t\"q\n\x18\x44irectoryContentResponse\x12/\n\x0b\x64irectories\x18\x01 \x03(\x0b\x32\x1a.catalog.DirectoryResponse\x12$\n\x05\x66iles\x18\x02 \x03(\x0b\x32\x15.catalog.FileResponse\"\x9f\x01\n\x13RegisterFileRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1b\n\x13parent_directory_id\x18\x02 \x01(\t\x12\x18\n\x10\x65xternal_file_id\x18\x03 \x01(\t\x12\x11\n\tis_public\x18\x04 \x01(\x08\x12\x17\n\x0f\x61llowed_readers\x18\x05 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x06 \x03(\r\"r\n\x11UpdateFileRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tis_public\x18\x03 \x01(\x08\x12\x17\n\x0f\x61llowed_readers\x18\x04 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x05 \x03(\r\"\x1f\n\x11\x44\x65leteFileRequest\x12\n\n\x02id\x18\x01 \x01(\t\"2\n\x0e\x44\x65leteResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2\x9e\x04\n\x0e\x43\x61talogService\x12N\n\x0f\x43reateDirectory\x12\x1f.catalog.CreateDirectoryRequest\x1a\x1a.catalog.DirectoryResponse\x12N\n\x0fUpdateDirectory\x12\x1f.catalog.UpdateDirectoryRequest\x1a\x1a.catalog.DirectoryResponse\x12K\n\x0f\x44\x65leteDirectory\x12\x1f.catalog.DeleteDirectoryRequest\x1a\x17.catalog.DeleteResponse\x12V\n\x13GetDirectoryContent\x12\x1c.catalog.GetDirectoryRequest\x1a!.catalog.DirectoryContentResponse\x12\x43\n\x0cRegisterFile\x12\x1c.catalog.RegisterFileRequest\x1a\x15.catalog.FileResponse\x12?\n\nUpdateFile\x12\x1a.catalog.UpdateFileRequest\x1a\x15.catalog.FileResponse\x12\x41\n\nDeleteFile\x12\x1a.catalog.DeleteFileRequest\x1a\x17.catalog.DeleteResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rcatalog.proto\x12\x07\x63\x61talog\"\x97\x01\n\x11\x44irectoryResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tparent_id\x18\x03 \x01(\t\x12\x11\n\tis_public\x18\x04 \x01(\x08\x12\x10\n\x08owner_id\x18\x05 \x01(\r\x12\x17\n\x0f\x61llowed_readers\x18\x06 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x07 \x03(\r\"\x99\x01\n\x0c\x46ileResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x18\n\x10\x65xternal_file_id\x18\x03 \x01(\t\x12\x11\n\tis_public\x18\x04 \x01(\x08\x12\x10\n\x08owner_id\x18\x05 \x01(\r\x12\x17\n\x0f\x61llowed_readers\x18\x06 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x07 \x03(\r\"~\n\x16\x43reateDirectoryRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tparent_id\x18\x02 \x01(\t\x12\x11\n\tis_public\x18\x03 \x01(\x08\x12\x17\n\x0f\x61llowed_readers\x18\x04 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x05 \x03(\r\"\x8a\x01\n\x16UpdateDirectoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tparent_id\x18\x03 \x01(\t\x12\x11\n\tis_public\x18\x04 \x01(\x08\x12\x17\n\x0f\x61llowed_readers\x18\x05 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x06 \x03(\r\"$\n\x16\x44\x65leteDirectoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\"+\n\x13GetDirectoryRequest\x12\x14\n\x0c\x64irectory_id\x18\x01 \x01(\t\"q\n\x0e\x44irectoryEntry\x12/\n\tdirectory\x18\x01 \x01(\x0b\x32\x1a.catalog.DirectoryResponseH\x00\x12%\n\x04\x66ile\x18\x02 \x01(\x0b\x32\x15.catalog.FileResponseH\x00\x42\x07\n\x05\x65ntry\"\x9f\x01\n\x13RegisterFileRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1b\n\x13parent_directory_id\x18\x02 \x01(\t\x12\x18\n\x10\x65xternal_file_id\x18\x03 \x01(\t\x12\x11\n\tis_public\x18\x04 \x01(\x08\x12\x17\n\x0f\x61llowed_readers\x18\x05 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x06 \x03(\r\"r\n\x11UpdateFileRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tis_public\x18\x03 \x01(\x08\x12\x17\n\x0f\x61llowed_readers\x18\x04 \x03(\r\x12\x17\n\x0f\x61llowed_writers\x18\x05 \x03(\r\"\x1f\n\x11\x44\x65leteFileRequest\x12\n\n\x02id\x18\x01 \x01(\t\"2\n\x0e\x44\x65leteResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2\x96\x04\n\x0e\x43\x61talogService\x12N\n\x0f\x43reateDirectory\x12\x1f.catalog.CreateDirectoryRequest\x1a\x1a.catalog.DirectoryResponse\x12N\n\x0fUpdateDirectory\x12\x1f.catalog.UpdateDirectoryRequest\x1a\x1a.catalog.DirectoryResponse\x12K\n\x0f\x44\x65leteDirectory\x12\x1f.catalog.DeleteDirectoryRequest\x1a\x17.catalog.DeleteResponse\x12N\n\x13GetDirectoryContent\x12\x1c.catalog.GetDirectoryRequest\x1a\x17.catalog.DirectoryEntry0\x01\x12\x43\n\x0cRegisterFile\x12\x1c.catalog.RegisterFileRequest\x1a\x15.catalog.FileResponse\x12?\n\nUpdateFile\x12\x1a.catalog.UpdateFileRequest\x1a\x15.catalog.FileResponse\x12\x41\n\nDeleteFile\x12\x1a.catalog.DeleteFileRequest\x1a\x17.catalog.DeleteResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -43,8 +43,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DELETEDIRECTORYREQUEST']._serialized_end=641
   _globals['_GETDIRECTORYREQUEST']._serialized_start=643
   _globals['_GETDIRECTORYREQUEST']._serialized_end=686
-  _globals['_DIRECTORYCONTENTRESPONSE']._serialized_start=688
-  _globals['_DIRECTORYCONTENTRESPONSE']._serialized_end=801
+  _globals['_DIRECTORYENTRY']._serialized_start=688
+  _globals['_DIRECTORYENTRY']._serialized_end=801
   _globals['_REGISTERFILEREQUEST']._serialized_start=804
   _globals['_REGISTERFILEREQUEST']._serialized_end=963
   _globals['_UPDATEFILEREQUEST']._serialized_start=965
@@ -54,5 +54,5 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DELETERESPONSE']._serialized_start=1114
   _globals['_DELETERESPONSE']._serialized_end=1164
   _globals['_CATALOGSERVICE']._serialized_start=1167
-  _globals['_CATALOGSERVICE']._serialized_end=1709
+  _globals['_CATALOGSERVICE']._serialized_end=1701
 # @@protoc_insertion_point(module_scope)
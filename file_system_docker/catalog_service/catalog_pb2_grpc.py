@@ -49,10 +49,10 @@ class CatalogServiceStub(object):
                 request_serializer=catalog__pb2.DeleteDirectoryRequest.SerializeToString,
                 response_deserializer=catalog__pb2.DeleteResponse.FromString,
                 _registered_method=True)
-        self.GetDirectoryContent = channel.unary_unary(
+        self.GetDirectoryContent = channel.unary_stream(
                 '/catalog.CatalogService/GetDirectoryContent',
                 request_serializer=catalog__pb2.GetDirectoryRequest.SerializeToString,
-                response_deserializer=catalog__pb2.DirectoryContentResponse.FromString,
+                response_deserializer=catalog__pb2.DirectoryEntry.FromString,
                 _registered_method=True)
         self.RegisterFile = channel.unary_unary(
                 '/catalog.CatalogService/RegisterFile',
@@ -134,10 +134,10 @@ def add_CatalogServiceServicer_to_server(servicer, server):
                     request_deserializer=catalog__pb2.DeleteDirectoryRequest.FromString,
                     response_serializer=catalog__pb2.DeleteResponse.SerializeToString,
             ),
-            'GetDirectoryContent': grpc.unary_unary_rpc_method_handler(
+            'GetDirectoryContent': grpc.unary_stream_rpc_method_handler(
                     servicer.GetDirectoryContent,
                     request_deserializer=catalog__pb2.GetDirectoryRequest.FromString,
-                    response_serializer=catalog__pb2.DirectoryContentResponse.SerializeToString,
+                    response_serializer=catalog__pb2.DirectoryEntry.SerializeToString,
             ),
             'RegisterFile': grpc.unary_unary_rpc_method_handler(
                     servicer.RegisterFile,
@@ -257,12 +257,12 @@ class CatalogService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/catalog.CatalogService/GetDirectoryContent',
             catalog__pb2.GetDirectoryRequest.SerializeToString,
-            catalog__pb2.DirectoryContentResponse.FromString,
+            catalog__pb2.DirectoryEntry.FromString,
             options,
             channel_credentials,
             insecure,
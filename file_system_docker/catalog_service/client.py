@@ -3,6 +3,7 @@ import grpc
 import catalog_pb2
 import catalog_pb2_grpc
 import time
+import types
 
 class TestCatalogService(unittest.TestCase):
     
@@ -25,6 +26,19 @@ class TestCatalogService(unittest.TestCase):
             parent_id=parent_id
         ))
 
+    def list_dir(self, directory_id):
+        """Helper to collect the GetDirectoryContent stream into directories/files lists."""
+        directories, files = [], []
+        stream = self.stub.GetDirectoryContent(
+            catalog_pb2.GetDirectoryRequest(directory_id=directory_id)
+        )
+        for entry in stream:
+            if entry.WhichOneof('entry') == 'directory':
+                directories.append(entry.directory)
+            else:
+                files.append(entry.file)
+        return types.SimpleNamespace(directories=directories, files=files)
+
     def test_01_directory_lifecycle(self):
         """Test Creating, Renaming, and Deleting a directory."""
         print("\n--- Test 1: Directory Lifecycle ---")
@@ -61,7 +75,7 @@ class TestCatalogService(unittest.TestCase):
         print(f"Created structure: {parent.name} -> {child.name}")
 
         # 2. Verify Content listing
-        content = self.stub.GetDirectoryContent(catalog_pb2.GetDirectoryRequest(directory_id=parent.id))
+        content = self.list_dir(parent.id)
         # Verify 'Child' is in the list of directories inside 'Parent'
         found_child = any(d.id == child.id for d in content.directories)
         self.assertTrue(found_child, "Child folder should appear in Parent's content")
@@ -95,7 +109,7 @@ class TestCatalogService(unittest.TestCase):
         print(f"Registered file: {f_obj.id}")
 
         # 3. List content to verify file is there
-        content = self.stub.GetDirectoryContent(catalog_pb2.GetDirectoryRequest(directory_id=folder.id))
+        content = self.list_dir(folder.id)
         found_file = any(f.id == f_obj.id for f in content.files)
         self.assertTrue(found_file, "File should appear in directory listing")
 
@@ -124,7 +138,7 @@ class TestCatalogService(unittest.TestCase):
         # Verify the move
         # 1. Check Folder B's parent
         # (We don't have a GetDirectory method in proto, so we check content of A)
-        content_a = self.stub.GetDirectoryContent(catalog_pb2.GetDirectoryRequest(directory_id=folder_a.id))
+        content_a = self.list_dir(folder_a.id)
         found_b_in_a = any(d.id == folder_b.id for d in content_a.directories)
         self.assertTrue(found_b_in_a, "Folder B should now be inside Folder A")
         print("Folder B successfully moved into Folder A")
@@ -1,5 +1,7 @@
+import asyncio
 import grpc
-from concurrent import futures
+import contextvars
+import itertools
 import logging
 import os
 import sys
@@ -12,8 +14,9 @@ import file_pb2_grpc
 import auth_pb2
 import auth_pb2_grpc
 
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, ReturnDocument
 from bson.objectid import ObjectId
+from cachetools import TTLCache
 
 # --- Настройки ---
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -24,96 +27,206 @@ MONGO_URI = os.getenv('MONGO_URI', 'mongodb://mongo:27017/')
 AUTH_SERVICE_ADDR = os.getenv('AUTH_SERVICE_ADDR', 'auth-service:50053')
 FILE_SERVICE_ADDR = os.getenv('FILE_SERVICE_ADDR', 'file-service:50052')
 LISTEN_PORT = os.getenv('PORT', '50051')
+CHANNEL_POOL_SIZE = int(os.getenv('CHANNEL_POOL_SIZE', '4'))
+USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', '30'))
+USER_NEG_CACHE_TTL = int(os.getenv('USER_NEG_CACHE_TTL', '5'))
+
+# Политика keepalive сервера: клиенты (тесты) пингуют раз в 10 с, это не должно
+# считаться злоупотреблением и приводить к GOAWAY too_many_pings
+SERVER_OPTIONS = [
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.min_ping_interval_without_data_ms', 5000),
+]
 
 # --- База данных ---
-try:
-    client = MongoClient(MONGO_URI)
-    db = client['catalog_db']
-    dirs_col = db['directories']
-    files_col = db['files']
-    client.server_info()
-    logger.info(f"Connected to MongoDB at {MONGO_URI}")
-except Exception as e:
-    logger.critical(f"Failed to connect to MongoDB: {e}")
-    sys.exit(1)
-
-
-class AuthInterceptor(grpc.ServerInterceptor):
+# Асинхронный драйвер PyMongo: соединение открывается при первом запросе внутри event loop.
+# Пул рассчитан на сотни одновременных RPC в одном event loop; при исчерпании
+# запрос ждет свободное соединение не дольше waitQueueTimeoutMS.
+client = AsyncMongoClient(
+    MONGO_URI,
+    maxPoolSize=64,
+    minPoolSize=8,
+    waitQueueTimeoutMS=2000,
+    serverSelectionTimeoutMS=2000,
+    retryWrites=True,
+)
+db = client['catalog_db']
+dirs_col = db['directories']
+files_col = db['files']
+
+
+async def connect_db():
+    try:
+        await client.admin.command('ping')
+        logger.info(f"Connected to MongoDB at {MONGO_URI}")
+    except Exception as e:
+        logger.critical(f"Failed to connect to MongoDB: {e}")
+        sys.exit(1)
+
+
+async def ensure_indexes():
+    """
+    Индексы под выборки по родителю и ACL-фильтры.
+    Повторный вызов для существующих индексов - no-op.
+    Отдельный индекс на parent_id не нужен: он - префикс составного.
+    """
+    await dirs_col.create_index([("parent_id", 1), ("is_public", 1)])
+    await dirs_col.create_index("owner_id")
+    await dirs_col.create_index("allowed_readers")
+    await dirs_col.create_index("allowed_writers")
+
+    await files_col.create_index([("parent_directory_id", 1), ("is_public", 1)])
+    await files_col.create_index("owner_id")
+    await files_col.create_index("allowed_readers")
+    await files_col.create_index("allowed_writers")
+    await files_col.create_index("external_file_id")
+
+# --- Кэш сессий ---
+# SessionID -> auth_pb2.User; неудачные токены кэшируются отдельно и короче
+_user_cache = TTLCache(maxsize=10000, ttl=USER_CACHE_TTL)
+_neg_user_cache = TTLCache(maxsize=10000, ttl=USER_NEG_CACHE_TTL)
+
+# ID пользователя, определенный интерсептором для текущего RPC (None - аноним).
+# grpc.aio выполняет интерсептор и обработчик в одной задаче asyncio, контекст общий.
+CURRENT_USER = contextvars.ContextVar('current_user', default=None)
+
+# Заголовок с токеном сессии: "authorization: Bearer <SessionID>"
+_AUTH_HEADER = 'authorization'
+_BEARER = 'Bearer '
+
+# (client_streaming, server_streaming) метода -> фабрика обработчика gRPC
+_HANDLER_TYPES = {
+    (False, False): grpc.unary_unary_rpc_method_handler,
+    (False, True): grpc.unary_stream_rpc_method_handler,
+    (True, False): grpc.stream_unary_rpc_method_handler,
+    (True, True): grpc.stream_stream_rpc_method_handler,
+}
+
+
+async def resolve_user(auth_pool, token):
+    """
+    Возвращает User по токену (или None), обращаясь к Auth только при промахе кэша.
+    Отказ Auth (UNAUTHENTICATED) кэшируется коротко, чтобы поток невалидных
+    токенов не нагружал Auth; прочие ошибки RPC пробрасываются наверх.
+    """
+    # Кэш трогаем только из event loop, блокировка не нужна
+    user = _user_cache.get(token)
+    if user is not None: return user
+    if token in _neg_user_cache: return None
+
+    try:
+        user = await auth_pool.stub().GetCurrentUser(auth_pb2.SessionData(SessionID=token))
+    except grpc.RpcError as e:
+        if e.code() == grpc.StatusCode.UNAUTHENTICATED:
+            _neg_user_cache[token] = True
+            return None
+        raise
+
+    _user_cache[token] = user
+    return user
+
+
+class ChannelPool:
+    """
+    Набор независимых каналов к одному адресу, стабы выдаются по кругу.
+    Уникальный grpc.channel_id не дает gRPC переиспользовать один subchannel,
+    поэтому каждый канал - отдельное HTTP/2 соединение.
+    Создавать внутри работающего event loop.
+    """
+    def __init__(self, addr, stub_class, size=CHANNEL_POOL_SIZE):
+        self._channels = [
+            grpc.aio.insecure_channel(addr, options=[('grpc.channel_id', i)])
+            for i in range(size)
+        ]
+        self._stubs = [stub_class(ch) for ch in self._channels]
+        self._counter = itertools.count()
+
+    def stub(self):
+        return self._stubs[next(self._counter) % len(self._stubs)]
+
+
+class AuthInterceptor(grpc.aio.ServerInterceptor):
     """
     Пропускает запросы на чтение (Get) для проверки прав внутри сервиса.
     Блокирует запросы на изменение (Create/Update/Delete) для анонимов.
+    Единственное место, где токен сверяется с Auth: результат кладется в CURRENT_USER.
     """
-    def __init__(self):
-        self.channel = grpc.insecure_channel(AUTH_SERVICE_ADDR)
-        self.stub = auth_pb2_grpc.AuthStub(self.channel)
+    def __init__(self, auth_pool):
+        self.auth_pool = auth_pool
+        # Классификация методов по дескриптору сервиса, один раз при старте:
+        # "/catalog.CatalogService/GetDirectoryContent" -> True
+        service = catalog_pb2.DESCRIPTOR.services_by_name['CatalogService']
+        self._read_ops = {
+            f"/{service.full_name}/{m.name}": m.name.startswith("Get")
+            for m in service.methods
+        }
+        # Обработчик-отказ должен быть того же типа, что и метод (GetDirectoryContent - поток)
+        self._abort_handler_types = {
+            f"/{service.full_name}/{m.name}": _HANDLER_TYPES[(m.client_streaming, m.server_streaming)]
+            for m in service.methods
+        }
 
-    def intercept_service(self, continuation, handler_call_details):
+    async def intercept_service(self, continuation, handler_call_details):
         method_name = handler_call_details.method
-        is_read_op = "Get" in method_name.split('/')[-1]
+        is_read_op = self._read_ops.get(method_name, False)
 
-        metadata = dict(handler_call_details.invocation_metadata)
-        token = metadata.get('authorization')
-        if token and token.startswith('Bearer '):
-            token = token.split(' ')[1]
+        # Один проход по заголовкам вместо построения dict на каждый RPC
+        token = next((v for k, v in handler_call_details.invocation_metadata
+                      if k == _AUTH_HEADER), None)
+        if token and token.startswith(_BEARER):
+            token = token[len(_BEARER):]
         
-        is_authenticated = False
-        if token:
-            try:
-                self.stub.GetCurrentUser(auth_pb2.SessionData(SessionID=token))
-                is_authenticated = True
-            except:
-                is_authenticated = False
+        try:
+            user = await resolve_user(self.auth_pool, token) if token else None
+        except grpc.RpcError as e:
+            # Недоступность Auth - не повод считать клиента анонимом
+            logger.error(f"Auth Service error: {e.code()}")
+            return self._abort(method_name, grpc.StatusCode.UNAVAILABLE, "Auth service unavailable")
+        is_authenticated = user is not None
+        # Обработчики читают пользователя отсюда, без повторного запроса в Auth
+        CURRENT_USER.set(user.ID if is_authenticated else None)
 
         # Если авторизован - проходим
         if is_authenticated:
-            return continuation(handler_call_details)
+            return await continuation(handler_call_details)
         else:
             # Если аноним и это чтение - проходим (сервис проверит публичность)
             if is_read_op:
-                return continuation(handler_call_details)
+                return await continuation(handler_call_details)
             # Если аноним хочет менять данные - отказ
             else:
-                return self._abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
+                return self._abort(method_name, grpc.StatusCode.UNAUTHENTICATED, "Auth required")
 
-    def _abort(self, code, details):
-        def abort_handler(request, context):
-            context.abort(code, details)
-        return grpc.unary_unary_rpc_method_handler(abort_handler)
+    def _abort(self, method_name, code, details):
+        async def abort_handler(request, context):
+            await context.abort(code, details)
+        make_handler = self._abort_handler_types.get(method_name, grpc.unary_unary_rpc_method_handler)
+        return make_handler(abort_handler)
 
 
 class FileServiceClient:
     def __init__(self):
-        self.channel = grpc.insecure_channel(FILE_SERVICE_ADDR)
-        self.stub = file_pb2_grpc.FileStub(self.channel)
+        self.pool = ChannelPool(FILE_SERVICE_ADDR, file_pb2_grpc.FileStub)
 
-    def delete_files(self, external_ids):
+    async def delete_files(self, external_ids):
+        """Удаляет все файлы одним запросом DeleteFiles"""
         if not external_ids: return
-        for ext_id in external_ids:
-            try:
-                self.stub.DeleteFile(file_pb2.DeleteFileRequest(UUID=ext_id, UserID=1))
-            except Exception as e:
-                logger.error(f"File Service error: {e}")
+        try:
+            await self.pool.stub().DeleteFiles(file_pb2.DeleteFilesRequest(UUIDs=external_ids, UserID=1))
+        except Exception as e:
+            logger.error(f"File Service error: {e}")
 
 
 class CatalogService(catalog_pb2_grpc.CatalogServiceServicer):
     def __init__(self):
         self.file_service = FileServiceClient()
-        self.auth_channel = grpc.insecure_channel(AUTH_SERVICE_ADDR)
-        self.auth_stub = auth_pb2_grpc.AuthStub(self.auth_channel)
 
     # --- Вспомогательные методы проверок ---
 
     def _get_user_identity(self, context):
-        """Возвращает (user_id, is_authenticated)"""
-        meta = dict(context.invocation_metadata())
-        token = meta.get('authorization')
-        if not token: return (None, False)
-        if token.startswith('Bearer '): token = token.split(' ')[1]
-        try:
-            user = self.auth_stub.GetCurrentUser(auth_pb2.SessionData(SessionID=token))
-            return (user.ID, True)
-        except:
-            return (None, False)
+        """Возвращает (user_id, is_authenticated) из контекста, заполненного AuthInterceptor"""
+        user_id = CURRENT_USER.get()
+        return (user_id, user_id is not None)
 
     def _can_read(self, doc, user_id):
         """
@@ -136,19 +249,41 @@ class CatalogService(catalog_pb2_grpc.CatalogServiceServicer):
         
         return False
 
-    def _can_write(self, doc, user_id):
-        """Проверка прав на изменение (Владелец + Редакторы)"""
-        if user_id is None: return False
-        
-        if user_id == doc.get('owner_id'): return True
-        if user_id in doc.get('allowed_writers', []): return True
-        return False
+    def _read_filter(self, user_id):
+        """То же условие, что и _can_read, но в виде фильтра MongoDB"""
+        if user_id is None:
+            return {"is_public": True}
+        return {"$or": [
+            {"is_public": True},
+            {"owner_id": user_id},
+            {"allowed_readers": user_id},
+            {"allowed_writers": user_id},
+        ]}
+
+    def _write_filter(self, user_id):
+        """Фильтр MongoDB для прав на изменение (Владелец + Редакторы)"""
+        return {"$or": [{"owner_id": user_id}, {"allowed_writers": user_id}]}
+
+    async def _parse_id(self, raw_id, context):
+        """ObjectId из строки запроса; некорректный ID отсекается до обращения к базе"""
+        if not ObjectId.is_valid(raw_id):
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid id")
+        return ObjectId(raw_id)
+
+    async def _abort_missing_or_denied(self, col, oid, context, not_found_msg, denied_msg):
+        """
+        Запрос с ACL в фильтре ничего не нашел: выясняем, нет объекта
+        или нет прав, дешевым запросом только по _id.
+        """
+        if await col.find_one({"_id": oid}, {"_id": 1}) is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, not_found_msg)
+        await context.abort(grpc.StatusCode.PERMISSION_DENIED, denied_msg)
 
     # --- Directory RPCs ---
 
-    def CreateDirectory(self, request, context):
+    async def CreateDirectory(self, request, context):
         user_id, is_auth = self._get_user_identity(context)
-        if not is_auth: context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
+        if not is_auth: await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
 
         doc = {
             "name": request.name, 
@@ -160,7 +295,7 @@ class CatalogService(catalog_pb2_grpc.CatalogServiceServicer):
         }
         
         try:
-            res = dirs_col.insert_one(doc)
+            res = await dirs_col.insert_one(doc)
             return catalog_pb2.DirectoryResponse(
                 id=str(res.inserted_id), name=doc['name'], parent_id=str(doc['parent_id'] or ""),
                 is_public=doc['is_public'], owner_id=doc['owner_id'],
@@ -168,17 +303,12 @@ class CatalogService(catalog_pb2_grpc.CatalogServiceServicer):
             )
         except Exception as e:
             logger.error(f"DB Error: {e}")
-            context.abort(grpc.StatusCode.INTERNAL, "Write failed")
+            await context.abort(grpc.StatusCode.INTERNAL, "Write failed")
 
-    def UpdateDirectory(self, request, context):
+    async def UpdateDirectory(self, request, context):
         user_id, is_auth = self._get_user_identity(context)
-        if not is_auth: context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
-
-        doc = dirs_col.find_one({"_id": ObjectId(request.id)})
-        if not doc: context.abort(grpc.StatusCode.NOT_FOUND, "Directory not found")
-
-        if not self._can_write(doc, user_id):
-            context.abort(grpc.StatusCode.PERMISSION_DENIED, "No write permission")
+        if not is_auth: await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
+        oid = await self._parse_id(request.id, context)
 
         update_fields = {}
         if request.name: 
@@ -186,99 +316,118 @@ class CatalogService(catalog_pb2_grpc.CatalogServiceServicer):
         if request.parent_id != "no_change":
             update_fields["parent_id"] = request.parent_id if request.parent_id else None
         
-        # Редакторы могут менять настройки доступа
-        if request.is_public != doc.get('is_public'):
-            update_fields["is_public"] = request.is_public
+        # Редакторы могут менять настройки доступа.
+        # После обновления is_public всегда равен запрошенному, поэтому пишем его без сравнения.
+        update_fields["is_public"] = request.is_public
             
         if request.allowed_readers:
             update_fields["allowed_readers"] = list(request.allowed_readers)
         if request.allowed_writers:
             update_fields["allowed_writers"] = list(request.allowed_writers)
 
+        # Записанные поля обратно из базы не тянем: ответ собирается из документа и update_fields
+        skip_written = {k: 0 for k in update_fields}
+
+        # Проверка прав и изменение - один атомарный запрос
         try:
-            if update_fields:
-                dirs_col.update_one({"_id": ObjectId(request.id)}, {"$set": update_fields})
-            
-            updated = dirs_col.find_one({"_id": ObjectId(request.id)})
-            return catalog_pb2.DirectoryResponse(
-                id=str(updated["_id"]), name=updated["name"], 
-                parent_id=str(updated.get("parent_id") or ""), 
-                is_public=updated.get('is_public', False),
-                owner_id=updated.get('owner_id'),
-                allowed_readers=updated.get('allowed_readers', []),
-                allowed_writers=updated.get('allowed_writers', [])
+            updated = await dirs_col.find_one_and_update(
+                {"_id": oid, **self._write_filter(user_id)}, {"$set": update_fields},
+                projection=skip_written, return_document=ReturnDocument.AFTER
             )
         except Exception as e:
             logger.error(f"DB Error: {e}")
-            context.abort(grpc.StatusCode.INTERNAL, "Update failed")
+            await context.abort(grpc.StatusCode.INTERNAL, "Update failed")
+
+        if updated is None:
+            await self._abort_missing_or_denied(dirs_col, oid, context,
+                                                "Directory not found", "No write permission")
+
+        merged = {**updated, **update_fields}
+        return catalog_pb2.DirectoryResponse(
+            id=str(merged["_id"]), name=merged["name"], 
+            parent_id=str(merged.get("parent_id") or ""), 
+            is_public=merged.get('is_public', False),
+            owner_id=merged.get('owner_id'),
+            allowed_readers=merged.get('allowed_readers', []),
+            allowed_writers=merged.get('allowed_writers', [])
+        )
 
-    def DeleteDirectory(self, request, context):
+    async def DeleteDirectory(self, request, context):
         user_id, is_auth = self._get_user_identity(context)
-        if not is_auth: context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
-
-        doc = dirs_col.find_one({"_id": ObjectId(request.id)})
-        if not doc: context.abort(grpc.StatusCode.NOT_FOUND, "Not found")
+        if not is_auth: await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
+        oid = await self._parse_id(request.id, context)
 
-        # Удаление только Владельцем
-        if doc.get('owner_id') != user_id:
-             context.abort(grpc.StatusCode.PERMISSION_DENIED, "Only owner can delete")
+        # Удаление только Владельцем: условие на owner_id проверяет сама MongoDB
+        owner_filter = {"_id": oid, "owner_id": user_id}
+        if await dirs_col.find_one(owner_filter, {"_id": 1}) is None:
+            await self._abort_missing_or_denied(dirs_col, oid, context,
+                                                "Not found", "Only owner can delete")
 
-        if dirs_col.count_documents({"parent_id": request.id}) > 0:
+        # Достаточно знать, есть ли хоть одна подпапка: find_one останавливается на первой
+        if await dirs_col.find_one({"parent_id": request.id}, {"_id": 1}) is not None:
              return catalog_pb2.DeleteResponse(success=False, message="Directory not empty")
         
-        files_col.delete_many({"parent_directory_id": request.id})
-        dirs_col.delete_one({"_id": ObjectId(request.id)})
+        # Одним проходом забираем _id и внешние ID: удаляем ровно те записи,
+        # чьи объекты потом освобождаем в File Service
+        files = [f async for f in files_col.find(
+            {"parent_directory_id": request.id}, {"external_file_id": 1}
+        )]
+        await files_col.delete_many({"_id": {"$in": [f["_id"] for f in files]}})
+        await self.file_service.delete_files([f["external_file_id"] for f in files])
+
+        # Файл или подпапка, добавленные после выборки выше, остались бы без родителя:
+        # в этом случае папку не удаляем
+        if (await files_col.find_one({"parent_directory_id": request.id}, {"_id": 1}) is not None
+                or await dirs_col.find_one({"parent_id": request.id}, {"_id": 1}) is not None):
+            return catalog_pb2.DeleteResponse(success=False, message="Directory not empty")
+
+        await dirs_col.delete_one(owner_filter)
         return catalog_pb2.DeleteResponse(success=True, message="Deleted")
 
-    def GetDirectoryContent(self, request, context):
+    async def GetDirectoryContent(self, request, context):
         """
         Основной метод получения контента с проверкой прав.
+        Отдает поток DirectoryEntry прямо из курсоров, не собирая листинг в памяти.
         """
         user_id, _ = self._get_user_identity(context)
         pid = request.directory_id if request.directory_id else None
 
         # 1. ЗАЩИТА ПАПКИ: Если запрашиваем конкретную папку, проверяем, пустят ли нас внутрь.
         if pid:
-            target_dir = dirs_col.find_one({"_id": ObjectId(pid)})
+            oid = await self._parse_id(pid, context)
+            # Для _can_read нужны только поля ACL, имя и прочее не тянем
+            target_dir = await dirs_col.find_one({"_id": oid}, {
+                "owner_id": 1, "is_public": 1, "allowed_readers": 1, "allowed_writers": 1})
             if not target_dir: 
-                context.abort(grpc.StatusCode.NOT_FOUND, "Directory not found")
+                await context.abort(grpc.StatusCode.NOT_FOUND, "Directory not found")
             
             # Если прав на чтение нет -> ВЫБРАСЫВАЕМ ОШИБКУ
             if not self._can_read(target_dir, user_id):
                 logger.warning(f"Access DENIED for user {user_id} to dir {pid}")
-                context.abort(grpc.StatusCode.PERMISSION_DENIED, "You do not have permission to view this directory")
-
-        # 2. ФИЛЬТРАЦИЯ КОНТЕНТА: Загружаем всё содержимое...
-        all_subdirs = dirs_col.find({"parent_id": pid})
-        all_files = files_col.find({"parent_directory_id": pid})
-
-        visible_dirs = []
-        visible_files = []
-
-        # ... и оставляем только то, что пользователю можно видеть.
-        for d in all_subdirs:
-            if self._can_read(d, user_id):
-                visible_dirs.append(catalog_pb2.DirectoryResponse(
-                    id=str(d["_id"]), name=d["name"], parent_id=str(d.get("parent_id") or ""),
-                    is_public=d.get('is_public', False), owner_id=d.get('owner_id'),
-                    allowed_readers=d.get('allowed_readers', []), allowed_writers=d.get('allowed_writers', [])
-                ))
-
-        for f in all_files:
-            if self._can_read(f, user_id):
-                visible_files.append(catalog_pb2.FileResponse(
-                    id=str(f["_id"]), name=f["name"], external_file_id=f["external_file_id"],
-                    is_public=f.get('is_public', False), owner_id=f.get('owner_id'),
-                    allowed_readers=f.get('allowed_readers', []), allowed_writers=f.get('allowed_writers', [])
-                ))
-
-        return catalog_pb2.DirectoryContentResponse(directories=visible_dirs, files=visible_files)
+                await context.abort(grpc.StatusCode.PERMISSION_DENIED, "You do not have permission to view this directory")
+
+        # 2. ФИЛЬТРАЦИЯ КОНТЕНТА: права проверяет сама MongoDB,
+        # из базы приходит только то, что пользователю можно видеть.
+        acl_filter = self._read_filter(user_id)
+        async for d in dirs_col.find({"$and": [{"parent_id": pid}, acl_filter]}):
+            yield catalog_pb2.DirectoryEntry(directory=catalog_pb2.DirectoryResponse(
+                id=str(d["_id"]), name=d["name"], parent_id=str(d.get("parent_id") or ""),
+                is_public=d.get('is_public', False), owner_id=d.get('owner_id'),
+                allowed_readers=d.get('allowed_readers', []), allowed_writers=d.get('allowed_writers', [])
+            ))
+
+        async for f in files_col.find({"$and": [{"parent_directory_id": pid}, acl_filter]}):
+            yield catalog_pb2.DirectoryEntry(file=catalog_pb2.FileResponse(
+                id=str(f["_id"]), name=f["name"], external_file_id=f["external_file_id"],
+                is_public=f.get('is_public', False), owner_id=f.get('owner_id'),
+                allowed_readers=f.get('allowed_readers', []), allowed_writers=f.get('allowed_writers', [])
+            ))
 
     # --- File RPCs ---
 
-    def RegisterFile(self, request, context):
+    async def RegisterFile(self, request, context):
         user_id, is_auth = self._get_user_identity(context)
-        if not is_auth: context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
+        if not is_auth: await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
         
         doc = {
             "name": request.name, 
@@ -289,70 +438,73 @@ class CatalogService(catalog_pb2_grpc.CatalogServiceServicer):
             "allowed_readers": list(request.allowed_readers),
             "allowed_writers": list(request.allowed_writers)
         }
-        res = files_col.insert_one(doc)
+        res = await files_col.insert_one(doc)
         return catalog_pb2.FileResponse(
             id=str(res.inserted_id), name=request.name, external_file_id=request.external_file_id,
             is_public=doc['is_public'], owner_id=doc['owner_id'],
             allowed_readers=doc['allowed_readers'], allowed_writers=doc['allowed_writers']
         )
 
-    def UpdateFile(self, request, context):
+    async def UpdateFile(self, request, context):
         user_id, is_auth = self._get_user_identity(context)
-        if not is_auth: context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
-
-        doc = files_col.find_one({"_id": ObjectId(request.id)})
-        if not doc: context.abort(grpc.StatusCode.NOT_FOUND, "File not found")
-
-        if not self._can_write(doc, user_id):
-            context.abort(grpc.StatusCode.PERMISSION_DENIED, "No write permission")
+        if not is_auth: await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
+        oid = await self._parse_id(request.id, context)
 
         update_fields = {}
         if request.name: 
             update_fields["name"] = request.name
         
-        if request.is_public != doc.get('is_public'):
-            update_fields["is_public"] = request.is_public
+        update_fields["is_public"] = request.is_public
             
         if request.allowed_readers:
              update_fields["allowed_readers"] = list(request.allowed_readers)
         if request.allowed_writers:
              update_fields["allowed_writers"] = list(request.allowed_writers)
 
-        if update_fields:
-            files_col.update_one({"_id": ObjectId(request.id)}, {"$set": update_fields})
-        
-        updated = files_col.find_one({"_id": ObjectId(request.id)})
+        skip_written = {k: 0 for k in update_fields}
+        updated = await files_col.find_one_and_update(
+            {"_id": oid, **self._write_filter(user_id)}, {"$set": update_fields},
+            projection=skip_written, return_document=ReturnDocument.AFTER
+        )
+        if updated is None:
+            await self._abort_missing_or_denied(files_col, oid, context,
+                                                "File not found", "No write permission")
+
+        merged = {**updated, **update_fields}
         return catalog_pb2.FileResponse(
-            id=str(updated["_id"]), name=updated["name"], external_file_id=updated["external_file_id"],
-            is_public=updated.get('is_public', False), owner_id=updated.get('owner_id'),
-            allowed_readers=updated.get('allowed_readers', []), allowed_writers=updated.get('allowed_writers', [])
+            id=str(merged["_id"]), name=merged["name"], external_file_id=merged["external_file_id"],
+            is_public=merged.get('is_public', False), owner_id=merged.get('owner_id'),
+            allowed_readers=merged.get('allowed_readers', []), allowed_writers=merged.get('allowed_writers', [])
         )
     
-    def DeleteFile(self, request, context):
+    async def DeleteFile(self, request, context):
         user_id, is_auth = self._get_user_identity(context)
-        if not is_auth: context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
-
-        doc = files_col.find_one({"_id": ObjectId(request.id)})
-        if not doc: context.abort(grpc.StatusCode.NOT_FOUND, "File not found")
-        
-        if doc.get('owner_id') != user_id:
-             context.abort(grpc.StatusCode.PERMISSION_DENIED, "Only owner can delete file")
-
-        files_col.delete_one({"_id": ObjectId(request.id)})
-        self.file_service.delete_files([doc['external_file_id']])
+        if not is_auth: await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Auth required")
+        oid = await self._parse_id(request.id, context)
+
+        # Проверка владельца и удаление - один запрос
+        # Из удаленной записи нужен только внешний ID для File Service
+        doc = await files_col.find_one_and_delete({"_id": oid, "owner_id": user_id},
+                                                  projection={"external_file_id": 1})
+        if doc is None:
+            await self._abort_missing_or_denied(files_col, oid, context,
+                                                "File not found", "Only owner can delete file")
+
+        await self.file_service.delete_files([doc['external_file_id']])
         return catalog_pb2.DeleteResponse(success=True, message="Deleted")
 
-def serve():
-    auth_interceptor = AuthInterceptor()
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=10),
-        interceptors=[auth_interceptor]
-    )
+async def serve():
+    await connect_db()
+    await ensure_indexes()
+    # Каналы grpc.aio привязаны к event loop, поэтому создаются здесь
+    auth_pool = ChannelPool(AUTH_SERVICE_ADDR, auth_pb2_grpc.AuthStub)
+    auth_interceptor = AuthInterceptor(auth_pool)
+    server = grpc.aio.server(interceptors=[auth_interceptor], options=SERVER_OPTIONS)
     catalog_pb2_grpc.add_CatalogServiceServicer_to_server(CatalogService(), server)
     server.add_insecure_port(f'[::]:{LISTEN_PORT}')
     logger.info(f"Catalog Service started on port {LISTEN_PORT}")
-    server.start()
-    server.wait_for_termination()
+    await server.start()
+    await server.wait_for_termination()
 
 if __name__ == '__main__':
-    serve()
+    asyncio.run(serve())
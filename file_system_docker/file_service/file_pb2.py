@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nfile.proto\x12\x08protobuf\x1a\x1bgoogle/protobuf/empty.proto\"1\n\x11\x44\x65leteFileRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x0e\n\x06UserID\x18\x02 \x01(\r2I\n\x04\x46ile\x12\x41\n\nDeleteFile\x12\x1b.protobuf.DeleteFileRequest\x1a\x16.google.protobuf.EmptyB\x02Z\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nfile.proto\x12\x08protobuf\x1a\x1bgoogle/protobuf/empty.proto\"1\n\x11\x44\x65leteFileRequest\x12\x0c\n\x04UUID\x18\x01 \x01(\t\x12\x0e\n\x06UserID\x18\x02 \x01(\r\"3\n\x12\x44\x65leteFilesRequest\x12\r\n\x05UUIDs\x18\x01 \x03(\t\x12\x0e\n\x06UserID\x18\x02 \x01(\r2\x8e\x01\n\x04\x46ile\x12\x41\n\nDeleteFile\x12\x1b.protobuf.DeleteFileRequest\x1a\x16.google.protobuf.Empty\x12\x43\n\x0b\x44\x65leteFiles\x12\x1c.protobuf.DeleteFilesRequest\x1a\x16.google.protobuf.EmptyB\x02Z\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,6 +35,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._serialized_options = b'Z\000'
   _globals['_DELETEFILEREQUEST']._serialized_start=53
   _globals['_DELETEFILEREQUEST']._serialized_end=102
-  _globals['_FILE']._serialized_start=104
-  _globals['_FILE']._serialized_end=177
+  _globals['_DELETEFILESREQUEST']._serialized_start=104
+  _globals['_DELETEFILESREQUEST']._serialized_end=155
+  _globals['_FILE']._serialized_start=158
+  _globals['_FILE']._serialized_end=300
 # @@protoc_insertion_point(module_scope)
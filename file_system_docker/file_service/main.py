@@ -1,23 +1,35 @@
+import asyncio
 import grpc
-from concurrent import futures
 import file_pb2
 import file_pb2_grpc
 from google.protobuf import empty_pb2
 import logging
 
+# Accept client keepalive pings (the test suite pings every 10s) without GOAWAY too_many_pings
+SERVER_OPTIONS = [
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.min_ping_interval_without_data_ms', 5000),
+]
+
 class FileServiceMock(file_pb2_grpc.FileServicer):
-    def DeleteFile(self, request, context):
+    async def DeleteFile(self, request, context):
         print(f"[File] DELETE request: UUID={request.UUID}, UserID={request.UserID}")
         return empty_pb2.Empty()
 
-def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=5))
+    async def DeleteFiles(self, request, context):
+        print(f"[File] BATCH DELETE request: {len(request.UUIDs)} files, UserID={request.UserID}")
+        for uuid in request.UUIDs:
+            print(f"[File]   - UUID={uuid}")
+        return empty_pb2.Empty()
+
+async def serve():
+    server = grpc.aio.server(options=SERVER_OPTIONS)
     file_pb2_grpc.add_FileServicer_to_server(FileServiceMock(), server)
     server.add_insecure_port('[::]:50052')
     print("File Service running on port 50052")
-    server.start()
-    server.wait_for_termination()
+    await server.start()
+    await server.wait_for_termination()
 
 if __name__ == '__main__':
     logging.basicConfig()
-    serve()
+    asyncio.run(serve())
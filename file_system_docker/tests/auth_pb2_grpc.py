@@ -40,6 +40,11 @@ class AuthStub(object):
                 request_serializer=auth__pb2.FullUserData.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 _registered_method=True)
+        self.CreateSessions = channel.stream_unary(
+                '/protobuf.Auth/CreateSessions',
+                request_serializer=auth__pb2.FullUserData.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
         self.GetCurrentUser = channel.unary_unary(
                 '/protobuf.Auth/GetCurrentUser',
                 request_serializer=auth__pb2.SessionData.SerializeToString,
@@ -56,21 +61,28 @@ class AuthServicer(object):
     """Missing associated documentation comment in .proto file."""
 
     def CreateSession(self, request, context):
-        """Создать сессию (Вход)
+        """Создать сессию (Вход)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateSessions(self, request_iterator, context):
+        """Создать несколько сессий одним потоком
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
     def GetCurrentUser(self, request, context):
-        """Проверить токен (вызывается Catalog Service)
+        """Проверить токен (вызывается Catalog Service)
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
     def Logout(self, request, context):
-        """Удалить сессию (Выход)
+        """Удалить сессию (Выход)
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -84,6 +96,11 @@ def add_AuthServicer_to_server(servicer, server):
                     request_deserializer=auth__pb2.FullUserData.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'CreateSessions': grpc.stream_unary_rpc_method_handler(
+                    servicer.CreateSessions,
+                    request_deserializer=auth__pb2.FullUserData.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
             'GetCurrentUser': grpc.unary_unary_rpc_method_handler(
                     servicer.GetCurrentUser,
                     request_deserializer=auth__pb2.SessionData.FromString,
@@ -132,6 +149,33 @@ class Auth(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def CreateSessions(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/protobuf.Auth/CreateSessions',
+            auth__pb2.FullUserData.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetCurrentUser(request,
             target,
@@ -0,0 +1,26 @@
+# Запуск под pytest, в том числе параллельно через pytest-xdist
+# (зависимости: pip install -r requirements.txt в этой папке):
+#   pytest -n auto -m "not serial"   - независимые тесты по процессам
+#   pytest -m serial                 - нагрузочные тесты, по одному
+# Сам test_suite.py остается обычным unittest и запускается без pytest.
+import os
+
+import pytest
+
+import test_suite
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "serial: тест нельзя гонять параллельно с другими (нагрузочный)")
+    # Очистка базы один раз: в контроллере xdist (или в обычном запуске) до старта воркеров,
+    # иначе setUpClass каждого воркера стирал бы папки соседних процессов
+    if not hasattr(config, "workerinput"):
+        test_suite.clear_catalog_db()
+        os.environ[test_suite.DB_CLEARED_ENV] = "1"
+
+
+def pytest_collection_modifyitems(config, items):
+    # Нагрузочные тесты меряют время и сами создают конкурентную нагрузку
+    for item in items:
+        if "_stress_" in item.name:
+            item.add_marker(pytest.mark.serial)
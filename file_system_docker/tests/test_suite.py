@@ -1,8 +1,13 @@
 import unittest
+import asyncio
+import atexit
 import grpc
-import uuid
+import grpc.aio
+import os
 import time
-import concurrent.futures
+import types
+import itertools
+import functools
 import random
 import logging
 from pymongo import MongoClient
@@ -15,59 +20,172 @@ import auth_pb2_grpc
 import file_pb2
 import file_pb2_grpc
 
+#Фабрики запросов для нагрузочных циклов: постоянные поля привязаны заранее
+_mk_root_dir = functools.partial(catalog_pb2.CreateDirectoryRequest, parent_id="")
+
+def _mk_child(name, parent):
+    return catalog_pb2.CreateDirectoryRequest(name=name, parent_id=parent)
+
+#Адреса сервисов: явный ipv4 без DNS-резолва localhost и гонки IPv6/IPv4
+CATALOG_ADDR = 'ipv4:127.0.0.1:50051'
+FILE_ADDR = 'ipv4:127.0.0.1:50052'
+AUTH_ADDR = 'ipv4:127.0.0.1:50053'
+
+#Общие параметры каналов: keepalive держит соединения живыми между тестами
+#(серверы разрешают такой интервал пингов, см. SERVER_OPTIONS в сервисах),
+#увеличенные окно чтения и буфер записи не душат нагрузочные тесты
+CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 10000),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_time_between_pings_ms', 10000),
+    ('grpc.http2.lookahead_bytes', 1 << 20),
+    ('grpc.http2.write_buffer_size', 1 << 20),
+]
+
+#Каналы живут весь процесс: повторные запуски класса (watch-режим, повторы в CI)
+#не платят заново за TCP/HTTP2 handshake. Закрываются при выходе из интерпретатора
+_CHANNELS = {}
+
+def get_channel(addr, channel_id=None):
+    key = (addr, channel_id)
+    channel = _CHANNELS.get(key)
+    if channel is None:
+        options = CHANNEL_OPTIONS if channel_id is None else CHANNEL_OPTIONS + [('grpc.channel_id', channel_id)]
+        channel = _CHANNELS[key] = grpc.insecure_channel(addr, options=options)
+    return channel
+
+def _close_channels():
+    for channel in _CHANNELS.values():
+        channel.close()
+    _CHANNELS.clear()
+
+atexit.register(_close_channels)
+
+#Выставляется conftest.py, когда база очищена один раз на весь запуск
+DB_CLEARED_ENV = 'CATALOG_TESTS_DB_CLEARED'
+
+def clear_catalog_db():
+    #Сброс БД, НЕ ВЫПОЛЯТЬ ТЕСТЫ НА PROD
+    try:
+        client = MongoClient('mongodb://localhost:27017/', serverSelectionTimeoutMS=2000)
+        #Очищаем коллекции, а не удаляем базу: индексы, созданные сервисом, остаются
+        db = client['catalog_db']
+        for name in ('directories', 'files'):
+            db[name].delete_many({})
+        print("[Setup] Collections in 'catalog_db' cleared.")
+        client.close()
+    except Exception as e:
+        print(f"[Setup] Warning: Could not clear database: {e}")
+
 class TestCatalogComplete(unittest.TestCase):
     
+    id_owner = 100
+    id_writer = 200
+    id_reader = 300
+    id_stranger = 999
+    #Персонажи, нужные классу: их сессии создаются в setUpClass одним потоком CreateSessions
+    personas = {"owner": id_owner, "writer": id_writer, "reader": id_reader, "stranger": id_stranger}
+
     @classmethod
     def setUpClass(cls):
         print("\n[Setup] Establishing connections...")
-        cls.catalog_channel = grpc.insecure_channel('localhost:50051')
+        cls.catalog_channel = get_channel(CATALOG_ADDR)
         cls.catalog_stub = catalog_pb2_grpc.CatalogServiceStub(cls.catalog_channel)
+        #Пул каналов для нагрузочных тестов: разный channel_id - отдельное TCP/HTTP2 соединение
+        cls.catalog_channels = [
+            get_channel(CATALOG_ADDR, channel_id=i)
+            for i in range(4)
+        ]
+        cls.catalog_stubs = itertools.cycle(
+            [catalog_pb2_grpc.CatalogServiceStub(ch) for ch in cls.catalog_channels]
+        )
         
-        cls.auth_channel = grpc.insecure_channel('localhost:50053')
+        cls.auth_channel = get_channel(AUTH_ADDR)
         cls.auth_stub = auth_pb2_grpc.AuthStub(cls.auth_channel)
 
-        cls.file_channel = grpc.insecure_channel('localhost:50052')
+        cls.file_channel = get_channel(FILE_ADDR)
         cls.file_stub = file_pb2_grpc.FileStub(cls.file_channel)
 
-        #Сброс БД, НЕ ВЫПОЛЯТЬ ТЕСТЫ НА PROD
-        try:
-            client = MongoClient('mongodb://localhost:27017/', serverSelectionTimeoutMS=2000)
-            client.drop_database('catalog_db')
-            print("[Setup] Database 'catalog_db' dropped.")
-            client.close()
-        except Exception as e:
-            print(f"[Setup] Warning: Could not drop database: {e}")
+        #При параллельном запуске (pytest -n) базу уже очистил conftest.py до старта воркеров
+        if not os.environ.get(DB_CLEARED_ENV):
+            clear_catalog_db()
+
+        cls._meta_cache = {}
+        #Случайные суффиксы нарезаются из одного буфера вместо os.urandom на каждый uuid4
+        cls._rand = os.urandom(4096)
+        cls._ridx = 0
+        cls.create_persona_sessions()
+
+        #Общая приватная папка для ACL-тестов, которые ее не меняют:
+        #читатель в allowed_readers, посторонний ни в одном списке
+        cls.acl_base = cls.catalog_stub.CreateDirectory(
+            catalog_pb2.CreateDirectoryRequest(name="ACL_Base", is_public=False, allowed_readers=[cls.id_reader]),
+            metadata=cls.meta_owner
+        )
+
+    @classmethod
+    def rand_hex(cls, nbytes=4):
+        #hex-строка из nbytes случайных байт; тесты идут последовательно, блокировка не нужна
+        if cls._ridx + nbytes > len(cls._rand):
+            cls._rand = os.urandom(4096)
+            cls._ridx = 0
+        chunk = cls._rand[cls._ridx:cls._ridx + nbytes]
+        cls._ridx += nbytes
+        return chunk.hex()
 
     @classmethod
-    def tearDownClass(cls):
-        cls.catalog_channel.close()
-        cls.auth_channel.close()
-        cls.file_channel.close()
-
-    def create_session(self, user_id, name):
-        #запуск сессии
-        session_id = f"sess-{name}-{uuid.uuid4().hex[:8]}"
-        self.auth_stub.CreateSession(auth_pb2.FullUserData(
+    def session_request(cls, user_id, name):
+        #данные новой сессии: (запрос для Auth, metadata для Catalog)
+        session_id = f"sess-{name}-{cls.rand_hex(4)}"
+        request = auth_pb2.FullUserData(
             user=auth_pb2.User(ID=user_id, Email=f"{name}@test.com", IsAuth=True),
             SessionID=session_id
-        ))
-        return (('authorization', f'Bearer {session_id}'),)
+        )
+        return request, (('authorization', f'Bearer {session_id}'),)
 
-    def setUp(self):
-        #Запускать перед каждым тестом, создает пользователей в заглушке авторизации
-        self.id_owner = 100
-        self.meta_owner = self.create_session(self.id_owner, "owner")
+    @classmethod
+    def create_sessions(cls, requests):
+        #запуск сессий одним клиентским потоком
+        try:
+            cls.auth_stub.CreateSessions(iter(requests))
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            #старый Auth без CreateSessions: унарные вызовы, но все сразу через .future()
+            futures = [cls.auth_stub.CreateSession.future(r) for r in requests]
+            for future in futures:
+                future.result()
 
-        self.id_writer = 200
-        self.meta_writer = self.create_session(self.id_writer, "writer")
+    @classmethod
+    def create_persona_sessions(cls):
+        #все сессии класса одним пакетом; кортеж metadata кэшируется по user id,
+        #общий для всех вызовов этого пользователя и не меняется
+        requests = []
+        for name, user_id in cls.personas.items():
+            if user_id not in cls._meta_cache:
+                request, cls._meta_cache[user_id] = cls.session_request(user_id, name)
+                requests.append(request)
+            setattr(cls, f"meta_{name}", cls._meta_cache[user_id])
+        if requests:
+            cls.create_sessions(requests)
 
-        self.id_reader = 300
-        self.meta_reader = self.create_session(self.id_reader, "reader")
+    def next_stub(self):
+        #стабы пула выдаются по кругу
+        return next(self.catalog_stubs)
 
-        self.id_stranger = 999
-        self.meta_stranger = self.create_session(self.id_stranger, "stranger")
-        
-        self.metadata = self.meta_owner
+    def get_content(self, directory_id, metadata=None):
+        #GetDirectoryContent отдает поток записей, собираем его в списки папок и файлов
+        content = types.SimpleNamespace(directories=[], files=[])
+        stream = self.catalog_stub.GetDirectoryContent(
+            catalog_pb2.GetDirectoryRequest(directory_id=directory_id), metadata=metadata
+        )
+        for entry in stream:
+            if entry.WhichOneof('entry') == 'directory':
+                content.directories.append(entry.directory)
+            else:
+                content.files.append(entry.file)
+        return content
 
     # ==========================================
     # Часть 1: функицональные тесты
@@ -75,90 +193,90 @@ class TestCatalogComplete(unittest.TestCase):
 
     #создание корневого каталога
     def test_01_create_root_directory(self):
-        dirname = f"Root_{uuid.uuid4().hex[:6]}"
+        dirname = f"Root_{self.rand_hex(3)}"
         resp = self.catalog_stub.CreateDirectory(
             catalog_pb2.CreateDirectoryRequest(name=dirname, parent_id=""),
-            metadata=self.metadata
+            metadata=self.meta_owner
         )
         self.assertTrue(resp.id)
         self.assertEqual(resp.name, dirname)
     #создание подкаталога
     def test_02_create_subdirectory(self):
-        parent = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Parent", parent_id=""), metadata=self.metadata)
-        child = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Child", parent_id=parent.id), metadata=self.metadata)
+        parent = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Parent", parent_id=""), metadata=self.meta_owner)
+        child = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Child", parent_id=parent.id), metadata=self.meta_owner)
         self.assertEqual(child.parent_id, parent.id)
     #получить пустой выход от пустой директории
     def test_03_get_directory_content_empty(self):
-        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="EmptyDir", parent_id=""), metadata=self.metadata)
-        content = self.catalog_stub.GetDirectoryContent(catalog_pb2.GetDirectoryRequest(directory_id=d.id), metadata=self.metadata)
+        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="EmptyDir", parent_id=""), metadata=self.meta_owner)
+        content = self.get_content(d.id, self.meta_owner)
         self.assertEqual(len(content.files), 0)
     #заполнить директорию
     def test_04_get_directory_content_populated(self):
-        root = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="RootPop", parent_id=""), metadata=self.metadata)
-        self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Sub1", parent_id=root.id), metadata=self.metadata)
-        self.catalog_stub.RegisterFile(catalog_pb2.RegisterFileRequest(name="f.txt", parent_directory_id=root.id, external_file_id="x"), metadata=self.metadata)
+        root = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="RootPop", parent_id=""), metadata=self.meta_owner)
+        self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Sub1", parent_id=root.id), metadata=self.meta_owner)
+        self.catalog_stub.RegisterFile(catalog_pb2.RegisterFileRequest(name="f.txt", parent_directory_id=root.id, external_file_id="x"), metadata=self.meta_owner)
         
-        content = self.catalog_stub.GetDirectoryContent(catalog_pb2.GetDirectoryRequest(directory_id=root.id), metadata=self.metadata)
+        content = self.get_content(root.id, self.meta_owner)
         self.assertEqual(len(content.directories), 1)
         self.assertEqual(len(content.files), 1)
     #переименовать директорию
     def test_05_rename_directory(self):
-        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="OldName", parent_id=""), metadata=self.metadata)
+        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="OldName", parent_id=""), metadata=self.meta_owner)
         updated = self.catalog_stub.UpdateDirectory(
             catalog_pb2.UpdateDirectoryRequest(id=d.id, name="NewName", parent_id="no_change"),
-            metadata=self.metadata
+            metadata=self.meta_owner
         )
         self.assertEqual(updated.name, "NewName")
     #переместить директорию
     def test_06_move_directory(self):
-        folder_a = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Folder A", parent_id=""), metadata=self.metadata)
-        folder_b = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Folder B", parent_id=""), metadata=self.metadata)
+        folder_a = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Folder A", parent_id=""), metadata=self.meta_owner)
+        folder_b = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Folder B", parent_id=""), metadata=self.meta_owner)
         updated_b = self.catalog_stub.UpdateDirectory(
             catalog_pb2.UpdateDirectoryRequest(id=folder_b.id, parent_id=folder_a.id),
-            metadata=self.metadata
+            metadata=self.meta_owner
         )
         self.assertEqual(updated_b.parent_id, folder_a.id)
     #арегистрировать файл
     def test_07_register_file(self):
-        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Docs", parent_id=""), metadata=self.metadata)
+        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Docs", parent_id=""), metadata=self.meta_owner)
         f = self.catalog_stub.RegisterFile(
             catalog_pb2.RegisterFileRequest(name="resume.pdf", parent_directory_id=d.id, external_file_id="ext-uuid-1"),
-            metadata=self.metadata
+            metadata=self.meta_owner
         )
         self.assertEqual(f.name, "resume.pdf")
     #удалить файл
     def test_08_delete_file(self):
-        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="DocsDel", parent_id=""), metadata=self.metadata)
-        f = self.catalog_stub.RegisterFile(catalog_pb2.RegisterFileRequest(name="del.txt", parent_directory_id=d.id, external_file_id="ext-uuid-2"), metadata=self.metadata)
-        res = self.catalog_stub.DeleteFile(catalog_pb2.DeleteFileRequest(id=f.id), metadata=self.metadata)
+        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="DocsDel", parent_id=""), metadata=self.meta_owner)
+        f = self.catalog_stub.RegisterFile(catalog_pb2.RegisterFileRequest(name="del.txt", parent_directory_id=d.id, external_file_id="ext-uuid-2"), metadata=self.meta_owner)
+        res = self.catalog_stub.DeleteFile(catalog_pb2.DeleteFileRequest(id=f.id), metadata=self.meta_owner)
         self.assertTrue(res.success)
     #удалить директорию с файлами
     def test_09_delete_directory_with_files(self):
-        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="WithFiles", parent_id=""), metadata=self.metadata)
-        self.catalog_stub.RegisterFile(catalog_pb2.RegisterFileRequest(name="f1", parent_directory_id=d.id, external_file_id="e1"), metadata=self.metadata)
-        res = self.catalog_stub.DeleteDirectory(catalog_pb2.DeleteDirectoryRequest(id=d.id), metadata=self.metadata)
+        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="WithFiles", parent_id=""), metadata=self.meta_owner)
+        self.catalog_stub.RegisterFile(catalog_pb2.RegisterFileRequest(name="f1", parent_directory_id=d.id, external_file_id="e1"), metadata=self.meta_owner)
+        res = self.catalog_stub.DeleteDirectory(catalog_pb2.DeleteDirectoryRequest(id=d.id), metadata=self.meta_owner)
         self.assertTrue(res.success)
     #неуспешное удаление при наличии поддиректорий
     def test_10_fail_delete_directory_with_subdirectories(self):
-        parent = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="ParentSafe", parent_id=""), metadata=self.metadata)
-        self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="ChildSafe", parent_id=parent.id), metadata=self.metadata)
-        res = self.catalog_stub.DeleteDirectory(catalog_pb2.DeleteDirectoryRequest(id=parent.id), metadata=self.metadata)
+        parent = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="ParentSafe", parent_id=""), metadata=self.meta_owner)
+        self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="ChildSafe", parent_id=parent.id), metadata=self.meta_owner)
+        res = self.catalog_stub.DeleteDirectory(catalog_pb2.DeleteDirectoryRequest(id=parent.id), metadata=self.meta_owner)
         self.assertFalse(res.success) 
     #передвинуть директорию в root
     def test_11_move_directory_to_root(self):
-        a = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="A_Root", parent_id=""), metadata=self.metadata)
-        b = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="B_Root", parent_id=a.id), metadata=self.metadata)
+        a = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="A_Root", parent_id=""), metadata=self.meta_owner)
+        b = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="B_Root", parent_id=a.id), metadata=self.meta_owner)
         updated = self.catalog_stub.UpdateDirectory(
             catalog_pb2.UpdateDirectoryRequest(id=b.id, parent_id=""),
-            metadata=self.metadata
+            metadata=self.meta_owner
         )
         self.assertEqual(updated.parent_id, "")
     #частичное обновление директории
     def test_12_update_directory_partial(self):
-        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Original", parent_id=""), metadata=self.metadata)
+        d = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Original", parent_id=""), metadata=self.meta_owner)
         upd = self.catalog_stub.UpdateDirectory(
             catalog_pb2.UpdateDirectoryRequest(id=d.id, name="Changed", parent_id="no_change"),
-            metadata=self.metadata
+            metadata=self.meta_owner
         )
         self.assertEqual(upd.name, "Changed")
 
@@ -168,35 +286,26 @@ class TestCatalogComplete(unittest.TestCase):
         pub = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="ACL_Pub", parent_id=root.id, is_public=True), metadata=self.meta_owner)
         priv = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="ACL_Priv", parent_id=root.id, is_public=False), metadata=self.meta_owner)
 
-        content = self.catalog_stub.GetDirectoryContent(catalog_pb2.GetDirectoryRequest(directory_id=root.id))
+        content = self.get_content(root.id)
         names = [d.name for d in content.directories]
         
         self.assertIn("ACL_Pub", names)
         self.assertNotIn("ACL_Priv", names)
     #проверить невозможность доступа к закрытому проекту
     def test_14_stranger_access_denied(self):
-        priv = self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="SecretBox", is_public=False), metadata=self.meta_owner)
-        
         with self.assertRaises(grpc.RpcError) as cm:
-            self.catalog_stub.GetDirectoryContent(
-                catalog_pb2.GetDirectoryRequest(directory_id=priv.id),
-                metadata=self.meta_stranger
-            )
+            self.get_content(self.acl_base.id, self.meta_stranger)
         self.assertEqual(cm.exception.code(), grpc.StatusCode.PERMISSION_DENIED)
     #проверка прав читателя
     def test_15_reader_rights(self):
         """ACL: Читатель может открыть, но не менять."""
-        d = self.catalog_stub.CreateDirectory(
-            catalog_pb2.CreateDirectoryRequest(name="ReadOnly", allowed_readers=[self.id_reader]),
-            metadata=self.meta_owner
-        )
         # Read OK
-        self.catalog_stub.GetDirectoryContent(catalog_pb2.GetDirectoryRequest(directory_id=d.id), metadata=self.meta_reader)
+        self.get_content(self.acl_base.id, self.meta_reader)
         
         # Write Fail
         with self.assertRaises(grpc.RpcError) as cm:
             self.catalog_stub.UpdateDirectory(
-                catalog_pb2.UpdateDirectoryRequest(id=d.id, name="Hacked"),
+                catalog_pb2.UpdateDirectoryRequest(id=self.acl_base.id, name="Hacked"),
                 metadata=self.meta_reader
             )
         self.assertEqual(cm.exception.code(), grpc.StatusCode.PERMISSION_DENIED)
@@ -210,20 +319,20 @@ class TestCatalogComplete(unittest.TestCase):
 
         # Читатель пытается зайти ДО получения прав (должен получить отказ)
         with self.assertRaises(grpc.RpcError) as cm:
-            self.catalog_stub.GetDirectoryContent(
-                catalog_pb2.GetDirectoryRequest(directory_id=d.id), 
-                metadata=self.meta_reader
-            )
+            self.get_content(d.id, self.meta_reader)
         self.assertEqual(cm.exception.code(), grpc.StatusCode.PERMISSION_DENIED)
 
-        # Писатель выдает права читателю
-        self.catalog_stub.UpdateDirectory(
-            catalog_pb2.UpdateDirectoryRequest(id=d.id, parent_id="no_change", allowed_readers=[self.id_reader]),
+        # Писатель переименовывает папку и выдает права читателю одним запросом
+        resp = self.catalog_stub.UpdateDirectory(
+            catalog_pb2.UpdateDirectoryRequest(id=d.id, name="Wiki_Renamed", parent_id="no_change", allowed_readers=[self.id_reader]),
             metadata=self.meta_writer
         )
+        self.assertEqual(resp.name, "Wiki_Renamed")
+        self.assertIn(self.id_reader, resp.allowed_readers)
+        self.assertIn(self.id_writer, resp.allowed_writers)
         
         # ПРОВЕРКА: Читатель заходит ПОСЛЕ получения прав (должно быть успешно)
-        self.catalog_stub.GetDirectoryContent(catalog_pb2.GetDirectoryRequest(directory_id=d.id), metadata=self.meta_reader)
+        self.get_content(d.id, self.meta_reader)
 
     #запрос на запись без токена
     def test_17_auth_missing_token_write(self):
@@ -236,6 +345,11 @@ class TestCatalogComplete(unittest.TestCase):
         with self.assertRaises(grpc.RpcError) as cm:
             self.catalog_stub.CreateDirectory(catalog_pb2.CreateDirectoryRequest(name="Hacker"), metadata=bad_meta)
         self.assertEqual(cm.exception.code(), grpc.StatusCode.UNAUTHENTICATED)
+    #некорректный ID отклоняется до обращения к базе
+    def test_21_invalid_object_id(self):
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.catalog_stub.DeleteDirectory(catalog_pb2.DeleteDirectoryRequest(id="not-an-object-id"), metadata=self.meta_owner)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
 
     # ==========================================
     # часть 2: стресс тесты
@@ -245,16 +359,16 @@ class TestCatalogComplete(unittest.TestCase):
         print("\n[Stress] Creating 100 directories concurrently...")
         count = 100
         
-        def create_one(i):
-            return self.catalog_stub.CreateDirectory(
-                catalog_pb2.CreateDirectoryRequest(name=f"StressDir_{i}", parent_id=""),
-                metadata=self.meta_owner
-            )
-
+        #multi-callable каждого канала пула берем один раз, а не на каждой итерации
+        calls = [self.next_stub().CreateDirectory.future for _ in self.catalog_channels]
+        
         start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            futures_list = [executor.submit(create_one, i) for i in range(count)]
-            results = [f.result() for f in concurrent.futures.as_completed(futures_list)]
+        #Все запросы уходят сразу через .future(), без пула потоков, по кругу по каналам
+        futures_list = [
+            calls[i % len(calls)](_mk_root_dir(name=f"StressDir_{i}"), metadata=self.meta_owner)
+            for i in range(count)
+        ]
+        results = [f.result() for f in futures_list]
         
         duration = time.time() - start_time
         print(f"   -> Finished in {duration:.4f}s")
@@ -266,23 +380,46 @@ class TestCatalogComplete(unittest.TestCase):
         current_parent = ""
         ids = []
         
+        cd = self.catalog_stub.CreateDirectory
+        
         start_time = time.time()
         for i in range(depth):
-            res = self.catalog_stub.CreateDirectory(
-                catalog_pb2.CreateDirectoryRequest(name=f"Level_{i}", parent_id=current_parent),
-                metadata=self.meta_owner
-            )
+            res = cd(_mk_child(f"Level_{i}", current_parent), metadata=self.meta_owner)
             current_parent = res.id
             ids.append(res.id)
             
         duration = time.time() - start_time
         print(f"   -> Finished in {duration:.4f}s")
         
+        #Удаление строго последовательное: каждый уровень - родитель следующего,
+        #и сервер отказывает в удалении папки с подпапками. Запросы, пущенные
+        #разом через .future(), сервер обрабатывает конкурентно и порядок не гарантирован
         for dir_id in reversed(ids):
-            self.catalog_stub.DeleteDirectory(
+            res = self.catalog_stub.DeleteDirectory(
                 catalog_pb2.DeleteDirectoryRequest(id=dir_id), 
                 metadata=self.meta_owner
             )
+            self.assertTrue(res.success)
+    #то же, что test_19, но из одного event loop через grpc.aio
+    def test_22_stress_create_directories_async(self):
+        print("\n[Stress] Creating 100 directories concurrently (grpc.aio)...")
+        count = 100
+
+        async def run():
+            #aio-канал привязан к event loop, поэтому создается внутри него
+            async with grpc.aio.insecure_channel(CATALOG_ADDR, options=CHANNEL_OPTIONS) as channel:
+                cd = catalog_pb2_grpc.CatalogServiceStub(channel).CreateDirectory
+                return await asyncio.gather(*[
+                    cd(_mk_root_dir(name=f"AsyncStressDir_{i}"), metadata=self.meta_owner)
+                    for i in range(count)
+                ])
+
+        start_time = time.time()
+        results = asyncio.run(run())
+        
+        duration = time.time() - start_time
+        print(f"   -> Finished in {duration:.4f}s")
+        self.assertEqual(len(results), count)
 
 if __name__ == '__main__':
     unittest.main()